@@ -1,64 +1,72 @@
-from flask import Flask, jsonify, request, Response, send_from_directory, redirect
+from flask import Flask, jsonify, request, Response, redirect
+from flask.json.provider import JSONProvider
+import orjson
 from flask_swagger_ui import get_swaggerui_blueprint
+import logging
 import threading
-import schedule
 import time
-import logging
 from datetime import datetime, timezone
 import os
-from main import scrape_reports, parse_country_report, insert_article_to_db, get_db_connection, setup_selenium, cleanup_selenium
-import io
-import requests as http_requests
-from pdfminer.high_level import extract_text
+from psycopg2.pool import SimpleConnectionPool, PoolError
+from db import db_conn, pool_stats, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+from pdf_text import extract_pdf_text
+from tasks import celery_app, run_scheduled_scraper, scrape_url_task, queue_embedding, _load_scraper_status, acquire_scrape_lock, release_scrape_lock, NLP_API_URL
+import tempfile
 from flask_cors import CORS
-try:
-    from docx import Document as DocxDocument
-except Exception:
-    DocxDocument = None
+from flask_compress import Compress
 import json
-import shutil
-import traceback
+import hashlib
+import uuid
+import functools
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """jsonify()/request.get_json() backed by orjson (C) instead of the stdlib json module."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app, resources={r"/*": {"origins": "*"}})
 
-# Global variables to track scraper status
-last_scrape_time = None
-last_scrape_status = "Never run"
-is_scraping = False
+# Reject oversized uploads before the body is read
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_UPLOAD_MB', '100')) * 1024 * 1024
 
-# File used to persist scraper status (shared across processes)
-STATUS_FILE = os.getenv("SCRAPER_STATUS_FILE", "/tmp/sdg_scraper_status.json")
+@app.errorhandler(413)
+def request_too_large(e):
+    return jsonify({"error": "file too large"}), 413
 
-def _load_scraper_status():
-    try:
-        with open(STATUS_FILE, "r") as fh:
-            return json.load(fh)
-    except Exception:
-        return {
-            "last_run": None,
-            "last_status": "Never run",
-            "currently_running": False
-        }
+# Compress responses >= 1 KB (article content can be hundreds of KB); gunicorn does not compress
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
 
-def _save_scraper_status(last_run, last_status, currently_running):
-    data = {
-        "last_run": last_run.isoformat() if last_run else None,
-        "last_status": last_status,
-        "currently_running": bool(currently_running)
-    }
-    tmp = STATUS_FILE + ".tmp"
-    with open(tmp, "w") as fh:
-        json.dump(data, fh)
-    try:
-        os.replace(tmp, STATUS_FILE)
-    except Exception:
-        # fallback if os.replace not available on some platforms
-        shutil.move(tmp, STATUS_FILE)
+# Under gevent (wsgi.py) threads are monkey-patched into greenlets; CPU-bound parsing must still
+# run on real OS threads (the PDFium lock in pdf_text.py is a real lock for the same reason)
+try:
+    from gevent import monkey as _gevent_monkey
+    _GEVENT_PATCHED = _gevent_monkey.is_module_patched('threading')
+except ImportError:
+    _GEVENT_PATCHED = False
+
+if _GEVENT_PATCHED:
+    from gevent.threadpool import ThreadPoolExecutor as _ExtractorPool
+else:
+    _ExtractorPool = ThreadPoolExecutor
+
+# Bounded pool for parsing uploaded files off the request thread
+EXTRACTOR = _ExtractorPool(max_workers=int(os.getenv('EXTRACT_WORKERS', 4)), thread_name_prefix='extract')
+# caps how many uploads may be parsed at once
+EXTRACT_SEM = threading.Semaphore(int(os.getenv('EXTRACT_MAX', 8)))
+EXTRACT_TIMEOUT = float(os.getenv('EXTRACT_TIMEOUT', 120))
 
 # API key env var used to protect endpoints that save to DB
 SAVE_API_KEY = os.getenv("SAVE_API_KEY", "")
@@ -71,7 +79,7 @@ def _require_api_key():
         key = request.headers.get('X-API-KEY')
     elif 'api_key' in request.args:
         key = request.args.get('api_key')
-    else:
+    elif request.mimetype == 'application/json':
         # try json body
         try:
             body = request.get_json(silent=True) or {}
@@ -86,77 +94,125 @@ def _require_api_key():
         return False, "Invalid API key"
     return True, None
 
-def run_scheduled_scraper():
-    """Run the scraper and update status"""
-    global last_scrape_time, last_scrape_status, is_scraping
+# Cached DB probe result so frequent health checks don't hit the database every time
+_HEALTH_TTL = float(os.getenv("HEALTH_TTL", "5"))
+_health_cache = {"ts": 0, "status": None}
+
+# Dedicated single-connection pool for health checks, so probes never compete with real traffic
+_health_pool = None
+_health_pool_lock = threading.Lock()
+# Only one probe at a time may use the health connection
+_health_probe_lock = threading.Lock()
+
+def _get_health_pool():
+    """Create the health-check pool on first use (not at import, so a down DB doesn't break startup)."""
+    global _health_pool
+    with _health_pool_lock:
+        if _health_pool is None:
+            _health_pool = SimpleConnectionPool(
+                1, 1,
+                host=DB_HOST,
+                port=DB_PORT,
+                dbname=DB_NAME,
+                user=DB_USER,
+                password=DB_PASSWORD,
+                connect_timeout=int(os.getenv("HEALTH_CONNECT_TIMEOUT", "3"))
+            )
+        return _health_pool
 
+def _check_database():
+    """Run SELECT 1 on the dedicated health connection; slow databases fail fast."""
+    pool = _get_health_pool()
+    conn = pool.getconn()
+    broken = False
     try:
-        is_scraping = True
-        last_scrape_time = datetime.now(timezone.utc)
-        last_scrape_status = "Running"
-        _save_scraper_status(last_scrape_time, last_scrape_status, is_scraping)
-
-        logger.info("Starting scheduled scraping job...")
-        
-        # Run the scraper
-        results = scrape_reports()
-        
-        last_scrape_time = datetime.now(timezone.utc)
-        last_scrape_status = f"Success - {len(results)} reports processed"
-        logger.info(f"Scraping completed successfully: {len(results)} reports")
-        _save_scraper_status(last_scrape_time, last_scrape_status, False)
-        
-    except Exception as e:
-        last_scrape_time = datetime.now(timezone.utc)
-        tb = traceback.format_exc()
-        logger.error(f"Scraping failed: {e}\n{tb}")
-        try:
-            # get last traceback frame for file:line info
-            import traceback as _tbmod, sys as _sys
-            tb_list = _tbmod.extract_tb(_sys.exc_info()[2])
-            if tb_list:
-                last_frame = tb_list[-1]
-                frame_info = f"{last_frame.filename}:{last_frame.lineno} in {last_frame.name}"
-            else:
-                frame_info = "no-traceback-frame"
-        except Exception:
-            frame_info = "traceback-extract-failed"
-        # Save concise status with frame info and exception message
-        last_scrape_status = f"Failed - {str(e)} | at {frame_info}"
-        _save_scraper_status(last_scrape_time, last_scrape_status, False)
+        with conn.cursor() as cur:
+            cur.execute("SET LOCAL statement_timeout = 1000")
+            cur.execute("SELECT 1")
+            cur.fetchone()
+        conn.rollback()
+    except Exception:
+        broken = True
+        raise
     finally:
-        is_scraping = False
-
-def scheduler_worker():
-    """Background worker for the scheduler"""
-    # Schedule scraper to run every Monday at 00:00 UTC
-    schedule.every().monday.at("00:00").do(run_scheduled_scraper)
+        # discard the connection on failure so the next probe reconnects
+        pool.putconn(conn, close=broken)
+
+def _cached_db_status():
+    if _health_cache["status"] is not None and time.monotonic() - _health_cache["ts"] < _HEALTH_TTL:
+        return _health_cache["status"]
+    return None
+
+def _db_status():
+    """Cached DB probe result ("healthy" or "unhealthy: ..."), refreshed after _HEALTH_TTL.
+       Single-flight: concurrent callers wait for one probe instead of all hitting the
+       one-connection health pool."""
+    cached = _cached_db_status()
+    if cached is not None:
+        return cached
+    with _health_probe_lock:
+        cached = _cached_db_status()
+        if cached is not None:
+            return cached
+        try:
+            # Check database connection
+            _check_database()
+            db_status = "healthy"
+        except PoolError as e:
+            # our own pool being busy says nothing about the database; keep the last answer
+            logger.warning(f"Health pool unavailable: {e}")
+            return _health_cache["status"] or "healthy"
+        except Exception as e:
+            db_status = f"unhealthy: {str(e)}"
+        _health_cache["status"] = db_status
+        _health_cache["ts"] = time.monotonic()
+        return db_status
 
-    logger.info("Scheduler started - will run every Monday at 00:00 UTC")
+# Set once the database has answered for the first time after startup
+_ready = threading.Event()
 
+def _wait_for_database():
+    """Ping the database with backoff until it answers, then mark the worker ready."""
+    delay = 1
     while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+        try:
+            with _health_probe_lock:
+                _check_database()
+                _health_cache["status"] = "healthy"
+                _health_cache["ts"] = time.monotonic()
+            _ready.set()
+            logger.info("Database reachable - worker ready")
+            return
+        except Exception as e:
+            logger.warning(f"Database not reachable yet ({e}), retrying in {delay}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 30)
+
+threading.Thread(target=_wait_for_database, name="db-readiness", daemon=True).start()
+
+@app.route('/livez', methods=['GET'])
+def livez():
+    """Liveness probe: the process is up and serving requests (no DB access)"""
+    return '', 200
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness probe: startup DB ping succeeded and the cached DB probe is healthy"""
+    if _ready.is_set() and _db_status() == "healthy":
+        return '', 200
+    return '', 503
 
 # Health check endpoint
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for Azure Web App"""
-    try:
-        # Check database connection
-        conn = get_db_connection()
-        with conn.cursor() as cur:
-            cur.execute("SELECT 1")
-            cur.fetchone()
-        conn.close()
-        db_status = "healthy"
-    except Exception as e:
-        db_status = f"unhealthy: {str(e)}"
+    # until the first successful DB ping, report "starting" without probing again
+    db_status = _db_status() if _ready.is_set() else "starting"
     
     scraper_status = _load_scraper_status()
 
     response = {
-        "status": "healthy",
+        "status": "healthy" if _ready.is_set() else "starting",
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "database": db_status,
         "server": "gunicorn" if __name__ != "__main__" else "flask-dev",
@@ -171,6 +227,14 @@ def health_check():
     status_code = 200 if db_status == "healthy" else 503
     return jsonify(response), status_code
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Database connection pool usage for this worker process"""
+    return jsonify({
+        "pid": os.getpid(),
+        "db_pool": pool_stats()
+    })
+
 @app.route('/scraper/status', methods=['GET'])
 def scraper_status():
     """Get detailed scraper status"""
@@ -186,19 +250,136 @@ def scraper_status():
 @app.route('/scraper/run', methods=['POST'])
 def manual_scraper_run():
     """Manually trigger scraper - require API key"""
-    if is_scraping:
-        return jsonify({"error": "Scraper is already running"}), 409
-    
     ok, err = _require_api_key()
     if not ok:
         return jsonify({"error": err}), 401
-    
-    # Run scraper in background thread
-    thread = threading.Thread(target=run_scheduled_scraper)
-    thread.daemon = True
-    thread.start()
 
-    return jsonify({"message": "Scraper started manually"}), 202
+    # Claim the run slot atomically before queueing, so concurrent POSTs can't both start a run
+    task_id = str(uuid.uuid4())
+    if not acquire_scrape_lock(task_id):
+        return jsonify({"error": "Scraper is already running"}), 409
+
+    # Queue scraper on the Celery workers
+    try:
+        task = run_scheduled_scraper.apply_async(task_id=task_id)
+    except Exception as e:
+        release_scrape_lock(task_id)
+        logger.error(f"Failed to queue scraper: {e}")
+        return jsonify({"error": "Failed to queue scraper"}), 503
+
+    return jsonify({"message": "Scraper started manually", "task_id": task.id}), 202
+
+@app.route('/scraper/tasks/<task_id>', methods=['GET'])
+def scraper_task_status(task_id):
+    """Get state (and result once finished) of a queued scraper task"""
+    res = celery_app.AsyncResult(task_id)
+    response = {
+        "task_id": task_id,
+        "state": res.state,
+        "result": None
+    }
+    if res.state == "SUCCESS":
+        response["result"] = res.result
+    elif res.state == "FAILURE":
+        response["result"] = {"error": str(res.result)}
+    return jsonify(response)
+
+def _embed_error(embed_json, has_document, allow_main_id=False):
+    """Return an error response if an embed request can't be honoured, else None.
+       allow_main_id lets /scraper/scrape embed a caller-supplied embed.main_id instead of a
+       saved document; that path queues writes with our NLP_WRITE_TOKEN, so it needs the API key."""
+    if not has_document:
+        if not allow_main_id:
+            return jsonify({"error": "Embedding requested but document was not saved. Provide save=true and valid API key"}), 400
+        if not embed_json.get('main_id'):
+            return jsonify({"error": "Embedding requested but document was not saved. Provide save=true and valid API key or include embed.main_id"}), 400
+        ok, err = _require_api_key()
+        if not ok:
+            return jsonify({"error": err}), 401
+    if not NLP_API_URL:
+        return jsonify({"error": "Embedding service not configured"}), 500
+    return None
+
+class ExtractionError(Exception):
+    """Raised when an uploaded file cannot be parsed at all."""
+
+# Heavy parser/scraper modules are imported on first use (cached) rather than at boot,
+# so gunicorn workers start and pass health checks sooner
+@functools.lru_cache(maxsize=None)
+def _get_docx_document():
+    try:
+        from docx import Document as DocxDocument
+    except Exception:
+        DocxDocument = None
+    return DocxDocument
+
+def _read_text(path):
+    """Read a file as text: UTF-8 if it decodes cleanly, otherwise latin-1 (decoded once)."""
+    with open(path, 'rb') as fh:
+        file_bytes = fh.read()
+    try:
+        return file_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        return file_bytes.decode('latin-1', errors='ignore')
+
+def _extract_pdf(path):
+    try:
+        return extract_pdf_text(path), "PDF_UPLOAD"
+    except Exception as e:
+        logger.error(f"Failed to extract uploaded PDF: {e}")
+        raise ExtractionError("Failed to extract PDF content")
+
+def _extract_docx(path):
+    try:
+        DocxDocument = _get_docx_document()
+        if DocxDocument is None:
+            raise RuntimeError("python-docx not installed")
+        doc = DocxDocument(path)
+        paragraphs = [p.text.strip() for p in doc.paragraphs if p.text and p.text.strip()]
+        return "\n".join(paragraphs), "DOCX_UPLOAD"
+    except Exception as e:
+        logger.error(f"Failed to extract uploaded DOCX/DOC: {e}")
+        # fallback to binary decode
+        return _read_text(path), "DOCX_UPLOAD_FALLBACK"
+
+def _extract_html(path):
+    try:
+        from bs4 import BeautifulSoup, SoupStrainer
+        # lxml (C) parser, and only <p> elements are built into the tree
+        with open(path, 'rb') as fh:
+            soup = BeautifulSoup(fh, 'lxml', parse_only=SoupStrainer('p'))
+        paragraphs = [text for text in (p.get_text(strip=True) for p in soup) if text]
+        return "\n".join(paragraphs), "HTML_UPLOAD"
+    except Exception as e:
+        logger.error(f"Failed to parse uploaded HTML: {e}")
+        return _read_text(path), "HTML_UPLOAD_FALLBACK"
+
+def _extract_plain(path):
+    return _read_text(path), "TEXT_UPLOAD"
+
+# Upload extractors keyed by lowercased file extension; anything else is read as text
+_HANDLERS = {
+    '.pdf': _extract_pdf,
+    '.docx': _extract_docx,
+    '.doc': _extract_docx,
+    '.html': _extract_html,
+    '.htm': _extract_html,
+}
+
+def _extract(filename, path):
+    """Extract text from an uploaded file spooled at path. Returns (content, content_source)."""
+    ext = os.path.splitext(filename)[1].lower()
+    return _HANDLERS.get(ext, _extract_plain)(path)
+
+def _extract_upload(filename, path):
+    """Run _extract on a spooled upload, removing the temp file once the parser is done with it."""
+    try:
+        return _extract(filename, path)
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
 
 @app.route('/scraper/upload', methods=['POST'])
 def upload_and_save():
@@ -212,6 +393,10 @@ def upload_and_save():
       - save: optional "true"/"false" (default "true")
       - embed: optional JSON string/object with { token, write_access,  }
     """
+    # Fail fast on a declared oversized body, before touching request.form
+    if request.content_length and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+        return jsonify({"error": "file too large"}), 413
+
     # API key check (only required for saving)
     # Note: we still permit upload+parse without API key when save=false
     save = request.form.get('save', 'true').lower() == 'true'
@@ -221,6 +406,44 @@ def upload_and_save():
         if not ok:
             return jsonify({"error": err}), 401
 
+    # Optionally embed (requires embed params). Embedding is strictly separate from saving,
+    # but the request is validated before anything is parsed or saved, so a bad embed
+    # payload never leaves a saved row behind for a retrying client to duplicate.
+    embed_raw = request.form.get('embed')
+    embed_json = None
+    # Accept embed object in multipart form (stringified JSON) or in JSON body;
+    # only parse the body as JSON when it actually is JSON (skips multipart uploads)
+    if request.mimetype == 'application/json':
+        body_json = request.get_json(silent=True)
+        if isinstance(body_json, dict):
+            embed_json = body_json.get('embed')
+
+    # If embed provided as form field (string), attempt to parse JSON
+    if embed_raw and not embed_json:
+        try:
+            embed_json = json.loads(embed_raw)
+        except Exception:
+            return jsonify({"error": "embed must be a valid JSON object"}), 400
+
+    # If embed present but is a string (from body), parse it
+    if isinstance(embed_json, str):
+        try:
+            embed_json = json.loads(embed_json)
+        except Exception:
+            return jsonify({"error": "embed must be a valid JSON object"}), 400
+
+    # If embed provided, validate required client fields (no env fallback)
+    if embed_json:
+        if not isinstance(embed_json, dict):
+            return jsonify({"error": "embed must be a JSON object"}), 400
+        missing = [k for k in ('token', 'write_access', 'api_url') if not embed_json.get(k)]
+        if missing:
+            return jsonify({"error": f"embed missing required fields: {', '.join(missing)}"}), 400
+        # uploads only embed documents saved by this same request
+        err = _embed_error(embed_json, save)
+        if err:
+            return err
+
     if 'file' not in request.files:
         return jsonify({"error": "No file provided"}), 400
 
@@ -233,55 +456,45 @@ def upload_and_save():
     
     # allow user-supplied title to override generated title
     user_title = request.form.get('title') or None
-    # embed handled separately below
-    file_bytes = file.read()
-    content = ""
-    content_source = "UPLOAD"
+    filename = file.filename or "uploaded_file"
 
+    # Spool the upload to disk (werkzeug copies in chunks) so parsers read from a path
+    # instead of holding a full in-memory copy of the file
+    tmp = tempfile.NamedTemporaryFile(delete=False, prefix="sdg_upload_", suffix=os.path.splitext(filename)[1])
     try:
-        filename = file.filename or "uploaded_file"
-        lower = filename.lower()
-        if lower.endswith('.pdf'):
-            try:
-                content = extract_text(io.BytesIO(file_bytes))
-                content_source = "PDF_UPLOAD"
-            except Exception as e:
-                logger.error(f"Failed to extract uploaded PDF: {e}")
-                return jsonify({"error": "Failed to extract PDF content"}), 500
-        elif lower.endswith('.docx') or lower.endswith('.doc'):
-            try:
-                if DocxDocument is None:
-                    raise RuntimeError("python-docx not installed")
-                doc = DocxDocument(io.BytesIO(file_bytes))
-                paragraphs = [p.text.strip() for p in doc.paragraphs if p.text and p.text.strip()]
-                content = "\n".join(paragraphs)
-                content_source = "DOCX_UPLOAD"
-            except Exception as e:
-                logger.error(f"Failed to extract uploaded DOCX/DOC: {e}")
-                # fallback to binary decode
-                try:
-                    content = file_bytes.decode('utf-8', errors='ignore')
-                except:
-                    content = file_bytes.decode('latin-1', errors='ignore')
-                content_source = "DOCX_UPLOAD_FALLBACK"
-        elif lower.endswith('.html') or lower.endswith('.htm'):
-            try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(file_bytes.decode('utf-8', errors='ignore'), 'html.parser')
-                paragraphs = [p.get_text(strip=True) for p in soup.find_all('p')]
-                content = "\n".join(paragraphs)
-                content_source = "HTML_UPLOAD"
-            except Exception as e:
-                logger.error(f"Failed to parse uploaded HTML: {e}")
-                content = file_bytes.decode('utf-8', errors='ignore')
-                content_source = "HTML_UPLOAD_FALLBACK"
-        else:
-            # Try to decode as text
+        file.save(tmp)
+    except Exception as e:
+        tmp.close()
+        os.unlink(tmp.name)
+        logger.error(f"Failed to store uploaded file: {e}")
+        return jsonify({"error": "Error processing file"}), 500
+    tmp.close()
+
+    # Parse on the extraction pool so a large document doesn't pin this worker.
+    # The semaphore slot is held until the extraction itself finishes (or is cancelled),
+    # not just until this request stops waiting, so it really bounds the work in flight.
+    EXTRACT_SEM.acquire()
+    try:
+        fut = EXTRACTOR.submit(_extract_upload, filename, tmp.name)
+    except Exception as e:
+        EXTRACT_SEM.release()
+        os.unlink(tmp.name)
+        logger.error(f"Failed to queue extraction of uploaded file: {e}")
+        return jsonify({"error": "Error processing file"}), 500
+    fut.add_done_callback(lambda _f: EXTRACT_SEM.release())
+    try:
+        content, content_source = fut.result(timeout=EXTRACT_TIMEOUT)
+    except FutureTimeoutError:
+        logger.error(f"Timed out extracting uploaded file {filename}")
+        if fut.cancel():
+            # never started, so _extract_upload won't remove the spooled file
             try:
-                content = file_bytes.decode('utf-8')
-            except:
-                content = file_bytes.decode('latin-1', errors='ignore')
-            content_source = "TEXT_UPLOAD"
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+        return jsonify({"error": "Timed out processing file, try again later"}), 503
+    except ExtractionError as e:
+        return jsonify({"error": str(e)}), 500
     except Exception as e:
         logger.error(f"Error processing uploaded file: {e}")
         return jsonify({"error": "Error processing file"}), 500
@@ -301,84 +514,26 @@ def upload_and_save():
     # Save to DB if requested
     saved_id = None
     if save:
-        conn = None
         try:
-            conn = get_db_connection()
-            saved_id = insert_article_to_db(conn, article_data, raw_html=None)
+            from main import insert_article_to_db
+            with db_conn() as conn:
+                saved_id = insert_article_to_db(conn, article_data, raw_html=None)
         except Exception as e:
             logger.error(f"Failed to save uploaded document: {e}")
             return jsonify({"error": f"Failed to save: {str(e)}"}), 500
-        finally:
-            if conn:
-                conn.close()
-
-    # Optionally embed (requires embed params). Embedding is strictly separate from saving.
-    embed_raw = request.form.get('embed')
-    embed_json = None
-    # Accept embed object in multipart form (stringified JSON) or in JSON body
-    try:
-        body_json = request.get_json(silent=True) or {}
-        if 'embed' in body_json:
-            embed_json = body_json.get('embed')
-    except:
-        body_json = {}
-
-    # If embed provided as form field (string), attempt to parse JSON
-    if embed_raw and not embed_json:
-        try:
-            embed_json = json.loads(embed_raw)
-        except Exception:
-            return jsonify({"error": "embed must be a valid JSON object"}), 400
 
-    # If embed present but is a string (from body), parse it
-    if isinstance(embed_json, str):
-        try:
-            embed_json = json.loads(embed_json)
-        except Exception:
-            return jsonify({"error": "embed must be a valid JSON object"}), 400
-
-    # If embed provided, validate required client fields (no env fallback)
-    if embed_json:
-        if not isinstance(embed_json, dict):
-            return jsonify({"error": "embed must be a JSON object"}), 400
-        missing = [k for k in ('token', 'write_access', 'api_url') if not embed_json.get(k)]
-        if missing:
-            return jsonify({"error": f"embed missing required fields: {', '.join(missing)}"}), 400
-
-    embedded = False
+    embed_task_id = None
     if embed_json:
-        # embedding requires either saved_id (this request) or embed.main_id supplied
-        if not saved_id :
-            return jsonify({"error": "Embedding requested but document was not saved. Provide save=true and valid API key"}), 400
-
-        try:
-            embed_body = {
-                "token": embed_json.get('token'),
-                "write_access": os.getenv("NLP_WRITE_TOKEN"),
-                "db": os.getenv("EMBEDDING_DB"),
-                "main_id": f"blog:{saved_id}",
-            }
-            embed_url = os.getenv("NLP_API_URL") 
-            resp = http_requests.post(
-                f"{embed_url.rstrip('/')}/api/embed/add",
-                json=embed_body,
-                timeout=30
-            )
-            if not resp.ok:
-                logger.error(f"Embedding failed: {resp.status_code} {resp.text}")
-                return jsonify({"error": "Embedding failed", "details": resp.text}), 502
-            embedded = True
-        except Exception as e:
-            logger.error(f"Error embedding document: {e}")
-            return jsonify({"error": f"Embedding error: {str(e)}"}), 500
+        # validated above; saving succeeded, so there is a document to embed
+        embed_task_id = queue_embedding(embed_json, saved_id)
 
     # Return parsed content even if not saved (separated behavior)
     return jsonify({
         "message": "Upload processed",
         "saved_id": saved_id,
-        "embedded": embedded,
+        "embed_task_id": embed_task_id,
         "article_data": article_data
-    }), 201 if saved_id else 200
+    }), 202 if embed_task_id else 201 if saved_id else 200
 
 @app.route('/scraper/scrape', methods=['POST'])
 def api_scrape_and_save():
@@ -393,6 +548,7 @@ def api_scrape_and_save():
         "save": false (default false),
         "embed": { prefix,  } (optional)
       }
+    Returns 202 with a task_id; poll GET /scraper/tasks/<task_id> for the result.
     """
     payload = request.get_json(silent=True)
     if not payload or 'url' not in payload:
@@ -405,75 +561,26 @@ def api_scrape_and_save():
     embed_json = payload.get('embed')
     user_title = payload.get('title') or None
 
-    saved_id = None
-
-    # For parsing we need selenium set up because parse_country_report may use Selenium
-    setup_selenium()
-    try:
-        article_data, raw_html = parse_country_report(url, report_type or ("AILA" if "aila" in url else "DRA"), country)
-    finally:
-        cleanup_selenium()
-
-    if not article_data:
-        return jsonify({"error": "Failed to parse the URL"}), 500
-
-    # If caller provided a title, prefer it over parsed title
-    if user_title:
-        article_data['title'] = user_title
-
     # If caller requested saving, require API key
     if save:
         ok, err = _require_api_key()
         if not ok:
             return jsonify({"error": err}), 401
 
-        conn = None
-        try:
-            conn = get_db_connection()
-            saved_id = insert_article_to_db(conn, article_data, raw_html)
-        except Exception as e:
-            logger.error(f"Failed to save scraped URL: {e}")
-            return jsonify({"error": f"Failed to save: {str(e)}"}), 500
-        finally:
-            if conn:
-                conn.close()
-
-    # Optionally embed (requires embed params). Embedding is separate from scraping.
-    embedded = False
+    # Optionally embed (requires embed params). Embedding is separate from scraping;
+    # it is queued by the scrape task once the document is saved
     if embed_json:
-        # embedding requires either saved_id (this request) or embed.main_id supplied
-        if not saved_id and not embed_json.get('main_id'):
-            return jsonify({"error": "Embedding requested but document was not saved. Provide save=true and valid API key or include embed.main_id"}), 400
+        err = _embed_error(embed_json, bool(save), allow_main_id=True)
+        if err:
+            return err
 
-        try:
-            embed_body = {
-                "token": embed_json.get('token'),
-                "write_access": os.getenv("NLP_WRITE_TOKEN"),
-                "db": os.getenv("EMBEDDING_DB"),
-                "main_id": f"blog:{saved_id}",
-            }
-            embed_url = os.getenv("NLP_API_URL")
-            resp = http_requests.post(
-                f"{embed_url.rstrip('/')}/api/embed/add",
-                json=embed_body,
-                timeout=30
-            )
-            if not resp.ok:
-                logger.error(f"Embedding failed: {resp.status_code} {resp.text}")
-                return jsonify({"error": "Embedding failed", "details": resp.text}), 502
-            embedded = True
-        except Exception as e:
-            logger.error(f"Error embedding document: {e}")
-            return jsonify({"error": f"Embedding error: {str(e)}"}), 500
+    # Scraping (Selenium) runs on the Celery workers; poll /scraper/tasks/<task_id> for the result
+    task = scrape_url_task.delay(url, report_type, country, save, embed_json, user_title)
 
-    # Return scraped content + metadata regardless of save
     return jsonify({
-        "message": "Scrape completed",
-        "parsed_success": article_data.get('success', False),
-        "article_data": article_data,
-        "saved_id": saved_id,
-        "embedded": embedded
-    }), 200
+        "message": "Scrape queued",
+        "task_id": task.id
+    }), 202
 
 # register swagger UI (serves the YAML at /openapi.yaml and UI at /docs)
 SWAGGER_URL = "/docs"             # URL for exposing Swagger UI (can be /swagger, /docs, etc.)
@@ -487,37 +594,30 @@ swaggerui_blueprint = get_swaggerui_blueprint(
 app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 
 # serve the openapi.yaml from the repository root
+# file is expected at project root next to app.py; read once and served from memory
+with open(os.path.join(os.path.dirname(__file__), 'openapi.yaml'), 'rb') as _fh:
+    _OPENAPI_YAML = _fh.read()
+_OPENAPI_ETAG = hashlib.sha256(_OPENAPI_YAML).hexdigest()
+
 @app.route('/openapi.yaml', methods=['GET'])
 def serve_openapi_yaml():
-    # file is expected at project root next to app.py
-    root_dir = os.path.dirname(__file__)
-    return send_from_directory(root_dir, 'openapi.yaml', mimetype='text/yaml')
+    if request.if_none_match.contains(_OPENAPI_ETAG):
+        resp = Response(status=304)
+    else:
+        resp = Response(_OPENAPI_YAML, mimetype='text/yaml')
+    resp.set_etag(_OPENAPI_ETAG)
+    resp.headers['Cache-Control'] = 'public, max-age=3600, immutable'
+    return resp
 
 @app.route('/', methods=['GET'])
 def root():
     """Root endpoint"""
     return redirect('/docs')
 
-# Initialize scheduler when app starts (not just in __main__)
-def init_scheduler():
-    """Initialize scheduler in production"""
-    if os.getenv("ENVIRONMENT") == "production" or __name__ != "__main__":
-        scheduler_thread = threading.Thread(target=scheduler_worker, daemon=True)
-        scheduler_thread.start()
-        logger.info("Production scheduler initialized")
-
-# Initialize scheduler for production
-init_scheduler()
-
 if __name__ == '__main__':
     # This only runs in development mode
     logger.warning("Running in DEVELOPMENT mode - do not use in production!")
     
-    # Start the scheduler for development
-    if not any(thread.name.startswith('Thread-') for thread in threading.enumerate()):
-        scheduler_thread = threading.Thread(target=scheduler_worker, daemon=True)
-        scheduler_thread.start()
-    
     # Start Flask development server
     port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port, debug=False)
@@ -0,0 +1,80 @@
+import os
+import logging
+import threading
+from contextlib import contextmanager
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Database connection
+DB_HOST = os.getenv("DB_HOST", "")
+DB_PORT = os.getenv("DB_PORT", "")
+DB_NAME = os.getenv("DB_NAME", "")
+DB_USER = os.getenv("DB_USER", "")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "")
+
+# Pool sizing (per process) and how long a request may wait for a free connection
+DB_MIN = int(os.getenv("DB_MIN", 5))
+DB_MAX = int(os.getenv("DB_MAX", 20))
+DB_ACQUIRE_TIMEOUT = float(os.getenv("DB_ACQUIRE_TIMEOUT", 10))
+
+def get_db_connection():
+    conn = psycopg2.connect(
+        host=DB_HOST,
+        port=DB_PORT,
+        dbname=DB_NAME,
+        user=DB_USER,
+        password=DB_PASSWORD
+    )
+    return conn
+
+# Process-wide pool, created on first use so every gunicorn worker builds its own after fork
+POOL = None
+_pool_lock = threading.Lock()
+# psycopg2 pools raise immediately when exhausted; the semaphore makes callers wait instead
+_pool_slots = threading.BoundedSemaphore(DB_MAX)
+
+def get_pool():
+    """Return the process-wide connection pool, creating it if needed."""
+    global POOL
+    with _pool_lock:
+        if POOL is None:
+            POOL = ThreadedConnectionPool(
+                DB_MIN,
+                DB_MAX,
+                host=DB_HOST,
+                port=DB_PORT,
+                dbname=DB_NAME,
+                user=DB_USER,
+                password=DB_PASSWORD
+            )
+            logger.info(f"Database pool created (min={DB_MIN}, max={DB_MAX})")
+        return POOL
+
+@contextmanager
+def db_conn():
+    """Borrow a pooled connection; it is returned (or discarded if broken) on exit."""
+    if not _pool_slots.acquire(timeout=DB_ACQUIRE_TIMEOUT):
+        raise TimeoutError(f"No database connection available after {DB_ACQUIRE_TIMEOUT}s")
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+    finally:
+        _pool_slots.release()
+
+def pool_stats():
+    """Sizes of the process-wide pool (zeros if not created yet)."""
+    if POOL is None:
+        return {"created": False, "min": DB_MIN, "max": DB_MAX, "in_use": 0, "idle": 0}
+    return {
+        "created": True,
+        "min": POOL.minconn,
+        "max": POOL.maxconn,
+        "in_use": len(POOL._used),
+        "idle": len(POOL._pool)
+    }
@@ -6,8 +6,11 @@ bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
 backlog = 2048
 
 # Worker processes
-workers = 1  # Keep at 1 for scheduled tasks to avoid conflicts
-worker_class = "sync"
+# Scraping and scheduling run on Celery workers, so web workers can scale freely
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+# I/O-bound (DB, embedding, Redis): gevent lets many requests wait concurrently per worker.
+# Run via wsgi:app so the stdlib is patched before the app is imported.
+worker_class = "gevent"
 worker_connections = 1000
 timeout = 300
 keepalive = 5
@@ -26,7 +29,8 @@ access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s"
 proc_name = "undp-scraper"
 
 # Server mechanics
-preload_app = True
+# each worker builds its own DB pool after fork
+preload_app = False
 daemon = False
 pidfile = "/tmp/gunicorn.pid"
 user = None
@@ -1,16 +1,20 @@
 import os
 import re
 import logging
-import psycopg2
-import schedule
 import time
 import json
+import hashlib
+import sqlite3
 from bs4 import BeautifulSoup
+import soupsieve
 from urllib.parse import urljoin
+from html import unescape
 from datetime import datetime, timezone, date
-from pdfminer.high_level import extract_text
-from io import BytesIO
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import aiohttp
 import tempfile
 import shutil
 from selenium import webdriver
@@ -19,7 +23,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
 from langdetect import detect, DetectorFactory
 import pycountry
 from geopy.geocoders import Nominatim
@@ -27,6 +34,14 @@ from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
 import time as time_module
 import glob
 import stat
+import atexit
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, CancelledError, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from db import get_db_connection
+from pdf_text import extract_pdf_text
 
 # Set seed for consistent language detection
 DetectorFactory.seed = 0
@@ -35,33 +50,44 @@ DetectorFactory.seed = 0
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database connection
-DB_HOST = os.getenv("DB_HOST", "")
-DB_PORT = os.getenv("DB_PORT", "")
-DB_NAME = os.getenv("DB_NAME", "")
-DB_USER = os.getenv("DB_USER", "")
-DB_PASSWORD = os.getenv("DB_PASSWORD", "")
-
-def get_db_connection():
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        dbname=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD
-    )
-    return conn
-
 REPORT_URLS = [
     "https://www.undp.org/digital/aila",
     "https://www.undp.org/digital/dra"
 ]
 
+# Max concurrent static page fetches / PDF downloads
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", 10))
+PDF_DOWNLOAD_WORKERS = int(os.getenv("PDF_DOWNLOAD_WORKERS", 16))
+EMBED_WORKERS = int(os.getenv("EMBED_WORKERS", 8))
+# Articles inserted per transaction during a scrape run
+SCRAPE_COMMIT_EVERY = max(1, int(os.getenv("SCRAPE_COMMIT_EVERY", 25)))
+
 # Initialize geocoder
 geolocator = Nominatim(user_agent="undp-reports-scraper-this-pama")
 
-# Cache for geocoding results to avoid repeated API calls
-geocoding_cache = {}
+# Geocoding results persisted across runs (country names are a small, stable set),
+# so Nominatim and its 1s rate-limit sleep are only hit for names never seen before
+GEOCODE_CACHE_FILE = os.getenv("GEOCODE_CACHE_FILE", "/tmp/sdg_geocode_cache.json")
+_geocode_lock = threading.Lock()
+
+def _load_geocoding_cache():
+    try:
+        with open(GEOCODE_CACHE_FILE, "r") as fh:
+            return json.load(fh)
+    except Exception:
+        return {}
+
+def _save_geocoding_cache():
+    # write-through: Celery pool processes exit without running atexit hooks
+    tmp = f"{GEOCODE_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as fh:
+            json.dump(geocoding_cache, fh)
+        os.replace(tmp, GEOCODE_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Could not persist geocoding cache: {e}")
+
+geocoding_cache = _load_geocoding_cache()
 
 # Selenium setup
 chrome_options = Options()
@@ -77,29 +103,20 @@ driver = None
 wait = None
 download_dir = None
 
-def setup_selenium():
-    """Create and set global Selenium Chrome webdriver with a reliable chromedriver path."""
-    global driver, wait, download_dir
-
-    # prepare download dir early so it can be applied to chrome prefs
-    download_dir = tempfile.mkdtemp(prefix="sdg_scraper_dl_")
+# Asset URL patterns blocked in the Selenium browser (PDF downloads are unaffected)
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.css"
+]
 
-    chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1280,1024")
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                                'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36')
+# Resolved chromedriver binary, found once per process; later driver starts skip
+# webdriver-manager and the recursive glob over its cache
+_chromedriver_path = None
 
-    prefs = {
-        "download.default_directory": download_dir,
-        "download.prompt_for_download": False,
-        "download.directory_upgrade": True,
-        "plugins.always_open_pdf_externally": True
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
+def _resolve_chromedriver():
+    """Locate an executable chromedriver (memoized)."""
+    global _chromedriver_path
+    if _chromedriver_path and os.access(_chromedriver_path, os.X_OK):
+        return _chromedriver_path
 
     # Install via webdriver-manager
     try:
@@ -154,9 +171,52 @@ def setup_selenium():
             "Try clearing webdriver-manager cache: rm -rf ~/.wdm/drivers/chromedriver"
         )
 
+    _chromedriver_path = selected
+    return selected
+
+def setup_selenium():
+    """Create and set global Selenium Chrome webdriver with a reliable chromedriver path."""
+    global driver, wait, download_dir
+
+    # never leak a running browser when (re)starting
+    if driver is not None:
+        cleanup_selenium()
+
+    # prepare download dir early so it can be applied to chrome prefs
+    download_dir = tempfile.mkdtemp(prefix="sdg_scraper_dl_")
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1280,1024")
+    # the scraper only reads markup: skip images and stop waiting once the DOM is ready
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                                'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36')
+
+    prefs = {
+        "download.default_directory": download_dir,
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+        "plugins.always_open_pdf_externally": True
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+
+    selected = _resolve_chromedriver()
+
     service = Service(selected)
     driver = webdriver.Chrome(service=service, options=chrome_options)
-    wait = WebDriverWait(driver, 20)
+    wait = WebDriverWait(driver, 10)
+
+    # Drop requests for assets nothing downstream reads
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+    except Exception as e:
+        logger.warning(f"Could not enable resource blocking: {e}")
 
     logger.info(f"Selenium started using chromedriver: {selected} (download_dir={download_dir})")
     return driver
@@ -166,7 +226,10 @@ def cleanup_selenium():
     global driver, download_dir
     
     if driver:
-        driver.quit()
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Failed to quit Selenium driver: {e}")
         driver = None
         
     # Clean up download directory
@@ -177,6 +240,42 @@ def cleanup_selenium():
         except Exception as e:
             logger.warning(f"Failed to clean up download directory: {e}")
 
+# Warm driver reused across scrapes in this process; quit at exit, and by the Celery
+# worker_process_shutdown hook in tasks.py for pool children, which skip atexit
+_driver_lock = threading.Lock()
+atexit.register(cleanup_selenium)
+
+def get_driver():
+    """Return the running Selenium driver, starting a new one if there is none or it died."""
+    if driver is not None and driver.session_id is not None:
+        try:
+            driver.current_url  # raises if the browser/session is gone
+            return driver
+        except Exception as e:
+            logger.warning(f"Selenium driver unresponsive, restarting: {e}")
+    return setup_selenium()
+
+def reset_selenium():
+    """Clear cookies and leftover downloads so the next job starts clean on the same browser."""
+    if driver is None:
+        return
+    try:
+        driver.delete_all_cookies()
+    except Exception as e:
+        logger.warning(f"Failed to reset Selenium session: {e}")
+    _clear_download_dir()
+
+@contextmanager
+def warm_selenium():
+    """Hold the warm driver for one scrape and reset its session state afterwards.
+       Chrome itself is only started if the scrape needs it (safe_get/download_and_parse_pdf
+       call get_driver()), so direct-PDF URLs never launch a browser."""
+    with _driver_lock:
+        try:
+            yield
+        finally:
+            reset_selenium()
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -185,12 +284,35 @@ HEADERS = {
     "Connection": "keep-alive",
 }
 
-def safe_get(url):
+# Shared keep-alive session for PDF downloads so repeated fetches from undp.org reuse
+# connections; pool_maxsize covers PDF_DOWNLOAD_WORKERS threads
+HTTP = requests.Session()
+HTTP.headers.update(HEADERS)
+_http_adapter = HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+)
+HTTP.mount("http://", _http_adapter)
+HTTP.mount("https://", _http_adapter)
+atexit.register(HTTP.close)
+
+# Keep-alive session for the NLP embedding service, shared by the EMBED_WORKERS threads
+EMBED = requests.Session()
+EMBED.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+EMBED.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+atexit.register(EMBED.close)
+
+def safe_get(url, wait_selector="body"):
+    """Load url in Chrome and return its rendered HTML once wait_selector is present"""
     try:
         logger.info(f"Accessing {url} via Selenium")
-        driver.get(url)
-        wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "body")))
-        html = driver.page_source
+        drv = get_driver()  # Chrome is only started once a page actually needs it
+        drv.get(url)
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector)))
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for {wait_selector} on {url}, using page as loaded")
+        html = drv.page_source
         class Response:
             status_code = 200
             text = html
@@ -200,9 +322,74 @@ def safe_get(url):
         logger.error(f"Failed to load {url} via Selenium: {e}")
         raise
 
+# Markers of bot-protection / JS challenge pages that only a real browser gets past
+_JS_CHALLENGE_MARKERS = (
+    "cf-browser-verification",
+    "challenge-platform",
+    "<title>just a moment...</title>",
+    "enable javascript and cookies to continue",
+)
+
+def needs_browser(html):
+    """True if a statically fetched page is a JS challenge rather than real content"""
+    sample = html[:20000].lower()
+    return any(marker in sample for marker in _JS_CHALLENGE_MARKERS)
+
+async def fetch_html(session, url, semaphore):
+    """Fetch one page with aiohttp, at most FETCH_CONCURRENCY at a time"""
+    async with semaphore:
+        async with session.get(url, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+            resp.raise_for_status()
+            return await resp.text()
+
+async def _fetch_all_html(urls):
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(*(fetch_html(session, u, semaphore) for u in urls), return_exceptions=True)
+    return dict(zip(urls, results))
+
+def fetch_all_html(urls):
+    """Fetch pages concurrently without a browser.
+       Returns {url: html}; pages that failed or hit a JS challenge are left out (use Selenium for those)."""
+    urls = list(urls)
+    if not urls:
+        return {}
+    pages = {}
+    for url, result in asyncio.run(_fetch_all_html(urls)).items():
+        if isinstance(result, Exception):
+            logger.warning(f"Static fetch failed for {url}: {result}")
+        elif needs_browser(result):
+            logger.info(f"JS challenge detected on {url}, falling back to Selenium")
+        else:
+            pages[url] = result
+    logger.info(f"Fetched {len(pages)}/{len(urls)} pages without Selenium")
+    return pages
+
+@lru_cache(maxsize=4096)
 def is_pdf_url(url):
     """Check if URL is a direct PDF link"""
-    return url.lower().endswith('.pdf') or '.pdf' in url.lower()
+    return url is not None and '.pdf' in url.lower()
+
+# Exact (lowercased) country names -> ISO3, so the common case skips pycountry's slow fuzzy search
+_EXACT_ISO3 = {}
+for _c in pycountry.countries:
+    for _attr in ("name", "official_name", "common_name"):
+        _name = getattr(_c, _attr, None)
+        if _name:
+            _EXACT_ISO3[_name.lower()] = _c.alpha_3
+_EXACT_ISO3.update({"usa": "USA", "us": "USA", "uk": "GBR"})
+
+@lru_cache(maxsize=1024)
+def lookup_iso3(country_name):
+    """ISO3 code for a country name: exact table first, fuzzy search only as a fallback"""
+    iso3 = _EXACT_ISO3.get(country_name.lower().strip())
+    if iso3:
+        return iso3
+    try:
+        return pycountry.countries.search_fuzzy(country_name)[0].alpha_3
+    except Exception:
+        return None
 
 def get_country_info(country_name):
     """Get country ISO3 code, lat, lng from country name using automatic geocoding"""
@@ -220,13 +407,21 @@ def get_country_info(country_name):
     lng = None
     
     try:
-        try:
-            country = pycountry.countries.search_fuzzy(country_name)[0]
-            iso3 = country.alpha_3
+        iso3 = lookup_iso3(country_name)
+        if iso3:
             logger.debug(f"Found ISO3 for {country_name}: {iso3}")
-        except:
+        else:
             logger.warning(f"Could not find ISO3 code for: {country_name}")
         
+        # Another spelling of the same country may already have coordinates
+        known = next((c for c in list(geocoding_cache.values())
+                      if iso3 and c["iso3"] == iso3 and c["lat"] is not None), None)
+        if known:
+            with _geocode_lock:
+                geocoding_cache[clean_name] = dict(known)
+                _save_geocoding_cache()
+            return iso3, known["lat"], known["lng"]
+        
         try:
             logger.debug(f"Geocoding country: {country_name}")
             location = geolocator.geocode(country_name, timeout=10)
@@ -245,11 +440,15 @@ def get_country_info(country_name):
         except Exception as e:
             logger.error(f"Unexpected geocoding error for {country_name}: {e}")
         
-        geocoding_cache[clean_name] = {
-            "iso3": iso3,
-            "lat": lat,
-            "lng": lng
-        }
+        with _geocode_lock:
+            geocoding_cache[clean_name] = {
+                "iso3": iso3,
+                "lat": lat,
+                "lng": lng
+            }
+            # only persist real answers; a timeout should be retried on the next run
+            if lat is not None:
+                _save_geocoding_cache()
         
         return iso3, lat, lng
         
@@ -257,13 +456,25 @@ def get_country_info(country_name):
         logger.error(f"Error getting country info for {country_name}: {e}")
         return None, None, None
 
+# Common English function words; used to skip langdetect on plainly English text
+_ENGLISH_STOPWORDS = re.compile(r"\b(the|and|of|in|to)\b", re.I)
+
+def _looks_english(sample):
+    """Cheap check: nearly all ASCII and at least three distinct English stopwords"""
+    ascii_chars = sum(1 for ch in sample if ord(ch) < 128)
+    if ascii_chars < 0.95 * len(sample):
+        return False
+    return len({w.lower() for w in _ENGLISH_STOPWORDS.findall(sample)}) >= 3
+
 def detect_language(text):
     """Detect language of text content"""
     if not text or len(text.strip()) < 50:
         return "en"
     
     try:
-        sample_text = text[:1000].strip()
+        sample_text = text[:512].strip()
+        if _looks_english(sample_text):
+            return "en"
         detected_lang = detect(sample_text)
         logger.debug(f"Detected language: {detected_lang}")
         return detected_lang
@@ -271,55 +482,74 @@ def detect_language(text):
         logger.warning(f"Language detection failed: {e}")
         return "en"
 
-def article_exists(conn, url):
-    """Check if article already exists in database"""
+def get_existing_articles(conn, urls):
+    """Return {url: {"id", "article_type"}} for the urls already in the database, in one query"""
     with conn.cursor() as cur:
-        cur.execute("SELECT 1 FROM articles WHERE url = %s", (url,))
-        return cur.fetchone() is not None
+        cur.execute("SELECT url, id, article_type FROM articles WHERE url = ANY(%s)", (list(urls),))
+        return {row[0]: {"id": row[1], "article_type": row[2]} for row in cur.fetchall()}
 
-def get_existing_article(conn, url):
-    """Return existing article id and article_type for a url, or None"""
-    with conn.cursor() as cur:
-        cur.execute("SELECT id, article_type FROM articles WHERE url = %s", (url,))
-        row = cur.fetchone()
-        if row:
-            return {"id": row[0], "article_type": row[1]}
-        return None
+# Set once this process has made sure the articles table has its country column
+_schema_checked = False
 
-def insert_article_to_db(conn, article_data, raw_html):
-    """Insert article into database including country name"""
+def ensure_schema(conn):
+    """Add the articles.country column if missing. Runs once per process, not per insert."""
+    global _schema_checked
+    if _schema_checked:
+        return
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT column_name 
+                FROM information_schema.columns 
+                WHERE table_name = 'articles' AND column_name = 'country'
+            """)
+            if not cur.fetchone():
+                cur.execute("ALTER TABLE articles ADD COLUMN IF NOT EXISTS country VARCHAR(100)")
+                logger.info("Added country column to articles table")
+        conn.commit()
+        _schema_checked = True
+    except Exception as e:
+        conn.rollback()
+        logger.warning(f"Error checking/adding country column: {e}")
+
+def insert_article_to_db(conn, article_data, raw_html, commit=True):
+    """Insert article into database including country name.
+       With commit=False the insert joins the caller's open transaction behind a savepoint,
+       so a failed article is undone without losing the rest of the batch. Batch callers run
+       ensure_schema() themselves before opening the batch: it commits/rolls back on its own."""
+    if commit:
+        ensure_schema(conn)
+    savepoint_sent = False
     try:
         with conn.cursor() as cur:
-            conn.rollback()
-            
             iso3, lat, lng = get_country_info(article_data["country"])
             language = detect_language(article_data["content"])
             
             current_date = date.today()
             current_timestamp = datetime.now()
             
-            # Check if country column exists, add if not
-            try:
-                cur.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'articles' AND column_name = 'country'
-                """)
-                if not cur.fetchone():
-                    cur.execute("ALTER TABLE articles ADD COLUMN country VARCHAR(100)")
-                    logger.info("Added country column to articles table")
-            except Exception as e:
-                logger.warning(f"Error checking/adding country column: {e}")
+            if not commit:
+                cur.execute("SAVEPOINT article_insert")
+                # only now is there a savepoint of ours to roll back to
+                savepoint_sent = True
             
-            # Insert into articles table including country
+            # Article, content and raw HTML in one round-trip
             cur.execute("""
-                INSERT INTO articles (
-                    url, language, title, posted_date, posted_date_str, 
-                    article_type, created_at, updated_at, deleted, has_lab,
-                    lat, lng, privilege, rights, tags, country,
-                    parsed_date, relevance, iso3
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
+                WITH a AS (
+                    INSERT INTO articles (
+                        url, language, title, posted_date, posted_date_str, 
+                        article_type, created_at, updated_at, deleted, has_lab,
+                        lat, lng, privilege, rights, tags, country,
+                        parsed_date, relevance, iso3
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    RETURNING id
+                ), c AS (
+                    INSERT INTO article_content (article_id, content, created_at, updated_at)
+                    SELECT id, %s, %s, %s FROM a
+                )
+                INSERT INTO raw_html (article_id, raw_html, created_at, updated_at)
+                SELECT id, %s, %s, %s FROM a
+                RETURNING article_id
             """, (
                 article_data["url"],
                 language,
@@ -339,40 +569,34 @@ def insert_article_to_db(conn, article_data, raw_html):
                 article_data["country"],  # Added country field
                 current_timestamp,
                 2,
-                iso3
-            ))
-            
-            article_id = cur.fetchone()[0]
-            
-            # Insert content
-            cur.execute("""
-                INSERT INTO article_content (article_id, content, created_at, updated_at)
-                VALUES (%s, %s, %s, %s)
-            """, (
-                article_id,
+                iso3,
+                # article_content
                 article_data["content"],
                 current_timestamp,
-                current_timestamp
-            ))
-            
-            # Insert raw HTML
-            cur.execute("""
-                INSERT INTO raw_html (article_id, raw_html, created_at, updated_at)
-                VALUES (%s, %s, %s, %s)
-            """, (
-                article_id,
+                current_timestamp,
+                # raw_html
                 raw_html if raw_html is not None else article_data.get("content"),
                 current_timestamp,
                 current_timestamp
             ))
             
-            conn.commit()
+            article_id = cur.fetchone()[0]
+            
+            if commit:
+                conn.commit()
+            else:
+                cur.execute("RELEASE SAVEPOINT article_insert")
+                savepoint_sent = False
             logger.info(f"Successfully inserted article ID {article_id}: {article_data['title'][:50]}...")
             return article_id
             
     except Exception as e:
         logger.error(f"Failed to insert article into database: {e}")
-        conn.rollback()
+        if commit:
+            conn.rollback()
+        elif savepoint_sent:
+            with conn.cursor() as cur:
+                cur.execute("ROLLBACK TO SAVEPOINT article_insert")
         raise
 
 def call_embedding_service(article_id):
@@ -394,7 +618,7 @@ def call_embedding_service(article_id):
         "main_id": f"blog:{article_id}"
     }
     try:
-        r = requests.post(f"{embed_url.rstrip('/')}/api/embed/add", json=body, timeout=30)
+        r = EMBED.post(f"{embed_url.rstrip('/')}/api/embed/add", json=body, timeout=30)
         if r.ok:
             logger.info(f"Embedded article {article_id}")
             return True
@@ -405,17 +629,26 @@ def call_embedding_service(article_id):
         logger.exception(f"Embedding error for {article_id}: {e}")
         return False
 
+# Listing-page selectors, compiled once instead of on every select() call
+_FEATURE_CARD = soupsieve.compile("div.feature__card")
+_H6_HEAD = soupsieve.compile("h6.coh-heading")
+_H5_HEAD = soupsieve.compile("h5.coh-heading")
+_H5 = soupsieve.compile("h5")
+_A_HREF = soupsieve.compile("a[href]")
+# Report page body text; only used when the page has no <main> or <article>
+_COH_CONTAINER = soupsieve.compile("div.coh-container")
+
 def extract_country_from_card(card):
     """Extract country name from card HTML"""
     try:
-        country_element = card.select_one("h5.coh-heading")
+        country_element = _H5_HEAD.select_one(card)
         if country_element:
             country = country_element.get_text(strip=True)
             if country:
                 logger.debug(f"Found country in card: {country}")
                 return country
         
-        h5_elements = card.select("h5")
+        h5_elements = _H5.select(card)
         if h5_elements:
             for h5 in h5_elements:
                 text = h5.get_text(strip=True)
@@ -430,52 +663,197 @@ def extract_country_from_card(card):
         logger.warning(f"Error extracting country from card: {e}")
         return "Unknown"
 
+class _DownloadEventHandler(FileSystemEventHandler):
+    """Wakes wait_for_download whenever something changes in the download directory"""
+    def __init__(self, changed):
+        self.changed = changed
+
+    def on_any_event(self, event):
+        self.changed.set()
+
+def _completed_download(download_dir):
+    """Path of a finished, non-empty PDF in download_dir, or None while Chrome is still writing"""
+    completed = None
+    try:
+        with os.scandir(download_dir) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.name.endswith(('.crdownload', '.tmp')):
+                    return None
+                if completed is None and entry.name.endswith('.pdf'):
+                    completed = entry
+    except OSError:
+        return None
+    
+    if completed is not None and completed.stat().st_size > 0:
+        return completed.path
+    return None
+
+def _clear_download_dir():
+    """Remove everything left in the Selenium download directory"""
+    try:
+        with os.scandir(download_dir) as it:
+            for entry in it:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    except (OSError, TypeError):
+        pass
+
 def wait_for_download(download_dir, timeout=60):
-    """Wait for download to complete and return the file path"""
+    """Wait for download to complete and return the file path.
+       Blocks on filesystem events (inotify) rather than polling, so it returns as soon as
+       Chrome renames the .crdownload file."""
     logger.info(f"Waiting for download in {download_dir}")
     
-    for i in range(timeout):
-        try:
-            files = [f for f in os.listdir(download_dir) if not f.startswith('.')]
-        except OSError:
-            files = []
-        
-        if files:
-            downloading_files = [f for f in files if f.endswith('.crdownload') or f.endswith('.tmp')]
-            if not downloading_files:
-                completed_files = [f for f in files if f.endswith('.pdf')]
-                if completed_files:
-                    file_path = os.path.join(download_dir, completed_files[0])
-                    if os.path.getsize(file_path) > 0:
-                        logger.info(f"Download completed: {file_path}")
-                        return file_path
-        
-        time_module.sleep(1)
+    changed = threading.Event()
+    observer = Observer()
+    observer.schedule(_DownloadEventHandler(changed), download_dir, recursive=False)
+    observer.start()
+    try:
+        deadline = time_module.monotonic() + timeout
+        while True:
+            # checked before each wait: the download may have finished before the observer started
+            file_path = _completed_download(download_dir)
+            if file_path:
+                logger.info(f"Download completed: {file_path}")
+                return file_path
+            remaining = deadline - time_module.monotonic()
+            if remaining <= 0:
+                break
+            changed.wait(remaining)
+            changed.clear()
+    finally:
+        observer.stop()
+        observer.join(timeout=5)
     
     logger.error(f"Download timeout after {timeout} seconds")
     return None
 
+# Extracted PDF text kept on disk across runs, keyed by URL and by content hash, so unchanged
+# reports (or the same file linked from DRA and AILA) are not downloaded and parsed again
+PDF_CACHE_FILE = os.getenv("PDF_CACHE_FILE", "/tmp/sdg_pdf_cache.sqlite")
+PDF_CACHE_MAX_AGE = int(os.getenv("PDF_CACHE_MAX_AGE_DAYS", 7)) * 86400
+_pdf_cache = None
+_pdf_cache_pid = None
+_pdf_cache_lock = threading.Lock()
+
+def _get_pdf_cache():
+    """Open the cache on first use (and again in a forked child, which must not share the handle)"""
+    global _pdf_cache, _pdf_cache_pid
+    if _pdf_cache is None or _pdf_cache_pid != os.getpid():
+        _pdf_cache = sqlite3.connect(PDF_CACHE_FILE, timeout=10, check_same_thread=False)
+        _pdf_cache.execute("""
+            CREATE TABLE IF NOT EXISTS pdf_text (
+                url TEXT PRIMARY KEY, sha256 TEXT, text TEXT, fetched_at INTEGER
+            )
+        """)
+        _pdf_cache.execute("CREATE INDEX IF NOT EXISTS pdf_text_sha256 ON pdf_text (sha256)")
+        _pdf_cache.commit()
+        _pdf_cache_pid = os.getpid()
+    return _pdf_cache
+
+def cached_pdf_text(url=None, sha256=None):
+    """Text of a fresh cache entry for this URL or content hash, or None"""
+    try:
+        with _pdf_cache_lock:
+            cache = _get_pdf_cache()
+            column, value = ("url", url) if url else ("sha256", sha256)
+            row = cache.execute(
+                f"SELECT text FROM pdf_text WHERE {column} = ? AND fetched_at > ? LIMIT 1",
+                (value, int(time.time()) - PDF_CACHE_MAX_AGE)
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        logger.warning(f"PDF cache lookup failed: {e}")
+        return None
+
+def cache_pdf_text(url, sha256, text):
+    try:
+        with _pdf_cache_lock:
+            cache = _get_pdf_cache()
+            cache.execute(
+                "INSERT OR REPLACE INTO pdf_text (url, sha256, text, fetched_at) VALUES (?, ?, ?, ?)",
+                (url, sha256, text, int(time.time()))
+            )
+            cache.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"PDF cache write failed: {e}")
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def download_pdf_to_tempfile(pdf_url):
+    """Stream a PDF to a temporary file (never holding the whole body in memory).
+       Returns the file path and the SHA-256 of its content."""
+    digest = hashlib.sha256()
+    with HTTP.get(pdf_url, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tf:
+            try:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    tf.write(chunk)
+                    digest.update(chunk)
+            except Exception:
+                tf.close()
+                os.remove(tf.name)
+                raise
+            return tf.name, digest.hexdigest()
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def extract_and_remove(path):
+    """Extract text from a downloaded PDF and delete the file. Top-level so it can run in a worker process."""
+    try:
+        return extract_pdf_text(path)
+    finally:
+        _remove_quietly(path)
+
+def extract_pdf_url(pdf_url):
+    """Download a PDF over HTTP and return its text, using the PDF cache where possible"""
+    text = cached_pdf_text(url=pdf_url)
+    if text is not None:
+        logger.info(f"Using cached PDF text: {pdf_url}")
+        return text
+    path, sha256 = download_pdf_to_tempfile(pdf_url)
+    text = cached_pdf_text(sha256=sha256)
+    if text is not None:
+        _remove_quietly(path)
+    else:
+        text = extract_and_remove(path)
+    cache_pdf_text(pdf_url, sha256, text)
+    return text
+
 def download_and_parse_pdf(pdf_url):
     """Download PDF and extract text content"""
     try:
         logger.info(f"Downloading PDF: {pdf_url}")
+        text_content = cached_pdf_text(url=pdf_url)
+        if text_content is not None:
+            return text_content, get_filename_from_url(pdf_url)
+        drv = get_driver()
+        _clear_download_dir()
         
-        try:
-            for file in os.listdir(download_dir):
-                file_path = os.path.join(download_dir, file)
-                try:
-                    os.remove(file_path)
-                except:
-                    pass
-        except OSError:
-            pass
-        
-        driver.get(pdf_url)
+        drv.get(pdf_url)
         downloaded_file = wait_for_download(download_dir)
         
         if downloaded_file and os.path.exists(downloaded_file):
             try:
-                text_content = extract_text(downloaded_file)
+                sha256 = _sha256_file(downloaded_file)
+                text_content = cached_pdf_text(sha256=sha256)
+                if text_content is None:
+                    text_content = extract_pdf_text(downloaded_file)
+                cache_pdf_text(pdf_url, sha256, text_content)
                 logger.info(f"Successfully extracted text from PDF: {len(text_content)} characters")
                 return text_content, os.path.basename(downloaded_file)
             except Exception as e:
@@ -495,9 +873,7 @@ def extract_pdf_directly(pdf_url):
         logger.info(f"Extracting PDF directly from: {pdf_url}")
         
         try:
-            pdf_response = requests.get(pdf_url, headers=HEADERS, timeout=30)
-            pdf_response.raise_for_status()
-            content = extract_text(BytesIO(pdf_response.content))
+            content = extract_pdf_url(pdf_url)
             logger.info(f"Successfully extracted PDF via requests: {len(content)} characters")
             return content, "PDF_DIRECT_REQUESTS"
         except Exception as e:
@@ -515,24 +891,11 @@ def extract_pdf_directly(pdf_url):
         logger.error(f"Error in direct PDF extraction: {e}")
         return None, "PDF_DIRECT_ERROR"
 
-def safe_split(s, sep=None, maxsplit=-1):
-    """Return list from s.split(...) but return [] if s is None."""
-    if s is None:
-        return []
-    try:
-        return s.split(sep, maxsplit)
-    except Exception:
-        return []
-
+@lru_cache(maxsize=4096)
 def get_filename_from_url(url, default="unknown.pdf"):
     """Return a safe basename for a URL (guards against None)."""
     try:
-        if not url:
-            return default
-        # use safe_split to avoid None errors
-        raw = safe_split(url, '?', 1)[0] if safe_split(url, '?', 1) else url
-        name = os.path.basename(raw)
-        return name if name else default
+        return os.path.basename(url.split('?', 1)[0]) or default
     except Exception:
         return default
 
@@ -603,8 +966,115 @@ def parse_country_report(url, report_type, country):
                 return article_data, None
         
         # Normal webpage parsing
-        response = safe_get(url)
-        soup = BeautifulSoup(response.text, "html.parser")
+        html = safe_get(url).text
+    except Exception as e:
+        logger.error(f"Failed to parse report {url}: {e}")
+        return _failed_article(url, report_type, country, e), None
+
+    return parse_country_report_from_html(html, url, report_type, country, start_time)
+
+# href of an <a> tag (double-, single- or unquoted); regex scan of the raw page instead of
+# building a soup and walking every <a>. Comments are dropped first, as the parser would.
+_A_HREF_RE = re.compile(
+    r"""<a\b[^>]*?(?<![\w-])href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.I
+)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+
+def find_pdf_link(html, url):
+    """Absolute URL of the first <a href> ending in .pdf on a report page, or None"""
+    if "<!--" in html:
+        html = _HTML_COMMENT_RE.sub("", html)
+    for m in _A_HREF_RE.finditer(html):
+        href = unescape(m.group(1) or m.group(2) or m.group(3) or "")
+        if href.lower().endswith(".pdf"):
+            return urljoin(url, href)
+    return None
+
+def prefetch_pdf_texts(pdf_urls):
+    """Download PDFs concurrently on threads (I/O) and extract their text on a process pool (CPU),
+       starting extraction as each download lands. Returns {pdf_url: text} for the successful ones."""
+    pdf_urls = list(dict.fromkeys(u for u in pdf_urls if u))
+    if not pdf_urls:
+        return {}
+
+    # Works in the solo-pool "scrape" worker; daemonic prefork children fall back below
+    try:
+        extractor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    except Exception as e:
+        logger.warning(f"Process pool unavailable ({e}), extracting PDFs in-process")
+        extractor = None
+
+    texts = {}
+    to_fetch = []
+    for pdf_url in pdf_urls:
+        cached = cached_pdf_text(url=pdf_url)
+        if cached is not None:
+            texts[pdf_url] = cached
+        else:
+            to_fetch.append(pdf_url)
+
+    hashes = {}
+    extractions = {}  # future -> (pdf_url, path)
+
+    def extract_here(pdf_url, path):
+        try:
+            texts[pdf_url] = extract_and_remove(path)
+            cache_pdf_text(pdf_url, hashes[pdf_url], texts[pdf_url])
+        except Exception as e:
+            logger.warning(f"Failed to extract PDF {pdf_url}: {e}")
+
+    with ThreadPoolExecutor(max_workers=PDF_DOWNLOAD_WORKERS) as downloader:
+        downloads = {downloader.submit(download_pdf_to_tempfile, u): u for u in to_fetch}
+        for fut in as_completed(downloads):
+            pdf_url = downloads[fut]
+            try:
+                path, hashes[pdf_url] = fut.result()
+            except Exception as e:
+                logger.warning(f"Failed to download PDF {pdf_url}: {e}")
+                continue
+            cached = cached_pdf_text(sha256=hashes[pdf_url])
+            if cached is not None:
+                _remove_quietly(path)
+                texts[pdf_url] = cached
+                cache_pdf_text(pdf_url, hashes[pdf_url], cached)
+                continue
+            if extractor is not None:
+                try:
+                    # only the file path crosses the process boundary
+                    extractions[extractor.submit(extract_and_remove, path)] = (pdf_url, path)
+                    continue
+                except Exception as e:
+                    # e.g. daemonic Celery worker processes may not spawn children
+                    logger.warning(f"Process pool failed ({e}), extracting PDFs in-process")
+                    extractor.shutdown(cancel_futures=True)
+                    extractor = None
+            extract_here(pdf_url, path)
+
+    for fut, (pdf_url, path) in extractions.items():
+        try:
+            texts[pdf_url] = fut.result()
+            cache_pdf_text(pdf_url, hashes[pdf_url], texts[pdf_url])
+        except (CancelledError, BrokenProcessPool):
+            # cancelled by the shutdown above, or the pool died: extract_and_remove never
+            # finished, so the file is still ours to parse (or at least delete)
+            if os.path.exists(path):
+                extract_here(pdf_url, path)
+            else:
+                logger.warning(f"Lost PDF {pdf_url} when the process pool failed")
+        except Exception as e:
+            logger.warning(f"Failed to extract PDF {pdf_url}: {e}")
+    if extractor is not None:
+        extractor.shutdown()
+
+    logger.info(f"Prefetched text for {len(texts)}/{len(pdf_urls)} PDFs")
+    return texts
+
+def parse_country_report_from_html(html, url, report_type, country, start_time=None, pdf_texts=None):
+    """Parse an already fetched report page and return article data and raw html.
+       pdf_texts optionally maps PDF URLs to already extracted text (see prefetch_pdf_texts)."""
+    try:
+        start_time = start_time or datetime.now(timezone.utc)
+        soup = BeautifulSoup(html, "lxml")
 
         title_tag = soup.find("h1")
         title = title_tag.get_text(strip=True) if title_tag else None
@@ -614,22 +1084,25 @@ def parse_country_report(url, report_type, country):
         elif country.lower() not in title.lower() and country != "Unknown":
             title = f"{title} - {country}"
 
-        pdf_link = None
-        for a in soup.find_all("a", href=True):
-            if a["href"].lower().endswith(".pdf"):
-                pdf_link = urljoin(url, a["href"])
-                break
+        pdf_link = find_pdf_link(html, url)
 
         content = ""
         content_source = "NONE"
         pdf_info = []
 
-        if pdf_link:
+        if pdf_link and (pdf_texts or {}).get(pdf_link):
+            logger.info(f"Using prefetched PDF: {pdf_link}")
+            content = pdf_texts[pdf_link]
+            content_source = "PDF"
+            pdf_info.append({
+                "url": pdf_link,
+                "content_length": len(content),
+                "extracted_successfully": True
+            })
+        elif pdf_link:
             logger.info(f"Found PDF link: {pdf_link}")
             try:
-                pdf_response = requests.get(pdf_link, headers=HEADERS)
-                pdf_response.raise_for_status()
-                content = extract_text(BytesIO(pdf_response.content))
+                content = extract_pdf_url(pdf_link)
                 content_source = "PDF"
                 pdf_info.append({
                     "url": pdf_link,
@@ -659,8 +1132,10 @@ def parse_country_report(url, report_type, country):
                     logger.error(f"Failed to fetch PDF via Selenium: {e2}")
                     content = ""
         else:
-            paragraphs = [p.get_text(strip=True) for p in soup.find_all("p")]
-            content = "\n".join(paragraphs)
+            # one tree walk over the page's main content instead of a get_text per <p>
+            # by priority, not document order: Cohesion pages put a header coh-container before <main>
+            main = soup.main or soup.article or _COH_CONTAINER.select_one(soup) or soup.body
+            content = main.get_text("\n", strip=True) if main else ""
             if content and len(content.strip()) > 50:
                 content_source = "WEB"
             else:
@@ -693,49 +1168,62 @@ def parse_country_report(url, report_type, country):
             "success": content_source in ["PDF", "WEB", "PDF_DIRECT_REQUESTS", "PDF_DIRECT_SELENIUM"]
         }
         
-        return article_data, response.text
+        return article_data, html
         
     except Exception as e:
         logger.error(f"Failed to parse report {url}: {e}")
-        return {
-            "title": f"ERROR: Failed to parse {url}",
-            "content": f"Error: {str(e)}",
-            "content_length": 0,
-            "content_source": "ERROR",
-            "url": url,
-            "country": country,
-            "iso3": None,
-            "lat": None,
-            "lng": None,
-            "language": "en",
-            "report_type": report_type,
-            "pdf_links_found": 0,
-            "pdf_info": [],
-            "extraction_timestamp": datetime.now(timezone.utc).isoformat(),
-            "processing_time_seconds": 0,
-            "success": False
-        }, None
+        return _failed_article(url, report_type, country, e), None
+
+def _failed_article(url, report_type, country, error):
+    """Article data recorded for a report that could not be parsed"""
+    return {
+        "title": f"ERROR: Failed to parse {url}",
+        "content": f"Error: {str(error)}",
+        "content_length": 0,
+        "content_source": "ERROR",
+        "url": url,
+        "country": country,
+        "iso3": None,
+        "lat": None,
+        "lng": None,
+        "language": "en",
+        "report_type": report_type,
+        "pdf_links_found": 0,
+        "pdf_info": [],
+        "extraction_timestamp": datetime.now(timezone.utc).isoformat(),
+        "processing_time_seconds": 0,
+        "success": False
+    }
 
 def scrape_reports():
     """Main scraping function"""
     logger.info("Starting scraping job...")
     
-    setup_selenium()
-    
     conn = get_db_connection()
+    ensure_schema(conn)
     all_extracted_data = []
+    to_embed = []
     
     try:
+        # Fetch both listing pages concurrently; they are static HTML, so Selenium is only
+        # started for a page that fails, is blocked, or comes back without any feature cards
+        index_pages = fetch_all_html(REPORT_URLS)
+
         for base_url in REPORT_URLS:
-            response = safe_get(base_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            html = index_pages.get(base_url)
+            soup = BeautifulSoup(html, "lxml") if html is not None else None
+            if soup is None or _FEATURE_CARD.select_one(soup) is None:
+                if html is not None:
+                    logger.info(f"No report cards in static HTML for {base_url}, falling back to Selenium")
+                response = safe_get(base_url, wait_selector="div.feature__card")
+                response.raise_for_status()
+                soup = BeautifulSoup(response.text, "lxml")
 
             report_cards = []
-            for card in soup.select("div.feature__card"):
-                label = card.select_one("h6.coh-heading")
+            for card in _FEATURE_CARD.select(soup):
+                label = _H6_HEAD.select_one(card)
                 if label and label.get_text(strip=True).lower() == "report":
-                    link = card.select_one("a[href]")
+                    link = _A_HREF.select_one(card)
                     if link:
                         url = urljoin(base_url, link["href"])
                         country = extract_country_from_card(card)
@@ -754,9 +1242,12 @@ def scrape_reports():
 
             report_type = "AILA" if "/aila" in base_url else "DRA" if "/dra" in base_url else "publication"
 
+            existing_map = get_existing_articles(conn, unique_reports.keys())
+
+            pending = []
             for i, (report_url, country) in enumerate(unique_reports.items(), 1):
                 try:
-                    existing = get_existing_article(conn, report_url)
+                    existing = existing_map.get(report_url)
                     if existing:
                         # If stored article_type differs from current report type, update and re-run embedding
                         if (existing.get("article_type") or "").upper() != (report_type or "").upper():
@@ -770,8 +1261,8 @@ def scrape_reports():
                                         WHERE id = %s
                                     """, (report_type, datetime.now(), existing["id"]))
                                 conn.commit()
-                                # call NLP embed API for this existing article id
-                                call_embedding_service(existing["id"])
+                                # re-embed this existing article id with the rest of the run
+                                to_embed.append(existing["id"])
                             except Exception as e:
                                 conn.rollback()
                                 logger.error(f"Failed to update article type for {existing['id']}: {e}")
@@ -779,33 +1270,73 @@ def scrape_reports():
                             logger.info(f"Article already exists in DB with same type, skipping: {report_url}")
                         continue
 
-                    logger.info(f"Processing {i}/{len(unique_reports)}: {country} - {report_url}")
+                    pending.append((i, report_url, country))
+                except Exception as e:
+                    logger.error(f"Failed to process {report_url}: {e}")
+
+            # Prefetch all new report pages concurrently (direct PDF links are downloaded when parsed)
+            report_pages = fetch_all_html([u for _, u, _ in pending if not is_pdf_url(u)])
+
+            # Download and extract the PDFs those pages link to in parallel
+            pdf_texts = prefetch_pdf_texts(
+                find_pdf_link(page, u) for u, page in report_pages.items()
+            )
+
+            # One transaction per listing, committed every SCRAPE_COMMIT_EVERY articles
+            # instead of after each insert
+            # ids only join to_embed once their transaction has committed
+            uncommitted = []
+            with conn:
+                inserted = 0
+                for i, report_url, country in pending:
+                    try:
+                        logger.info(f"Processing {i}/{len(unique_reports)}: {country} - {report_url}")
                     
-                    article_data, raw_html = parse_country_report(report_url, report_type, country)
-                    if article_data and article_data.get("success"):
-                        article_id = insert_article_to_db(conn, article_data, raw_html)
-                        article_data["database_id"] = article_id
+                        if report_url in report_pages:
+                            article_data, raw_html = parse_country_report_from_html(report_pages[report_url], report_url, report_type, country, pdf_texts=pdf_texts)
+                        else:
+                            article_data, raw_html = parse_country_report(report_url, report_type, country)
+                        if article_data and article_data.get("success"):
+                            article_id = insert_article_to_db(conn, article_data, raw_html, commit=False)
+                            article_data["database_id"] = article_id
+                            inserted += 1
 
-                        # optional: embed into NLP service if configured
-                        call_embedding_service(article_id)
+                            # optional: embed into NLP service if configured (batched below);
+                            # insert_article_to_db only returns once its savepoint is released
+                            uncommitted.append(article_id)
+                            if inserted % SCRAPE_COMMIT_EVERY == 0:
+                                conn.commit()
+                                to_embed.extend(uncommitted)
+                                uncommitted.clear()
 
-                        all_extracted_data.append(article_data)
-                    else:
-                        logger.warning(f"✗ No data extracted from {report_url}")
-                        if article_data:
-                            try:
-                                article_id = insert_article_to_db(conn, article_data, raw_html)
-                                article_data["database_id"] = article_id
-                            except:
-                                pass
                             all_extracted_data.append(article_data)
+                        else:
+                            logger.warning(f"✗ No data extracted from {report_url}")
+                            if article_data:
+                                try:
+                                    article_id = insert_article_to_db(conn, article_data, raw_html, commit=False)
+                                    article_data["database_id"] = article_id
+                                except:
+                                    pass
+                                all_extracted_data.append(article_data)
                             
-                except Exception as e:
-                    logger.error(f"Failed to process {report_url}: {e}")
+                    except Exception as e:
+                        logger.error(f"Failed to process {report_url}: {e}")
+            to_embed.extend(uncommitted)
                     
     finally:
+        # Embed everything committed this run, even if a later listing failed: articles that
+        # already exist are skipped on the next run, so they would otherwise never be embedded
+        try:
+            if to_embed:
+                with ThreadPoolExecutor(max_workers=EMBED_WORKERS) as pool:
+                    embedded = sum(pool.map(call_embedding_service, to_embed))
+                logger.info(f"Embedded {embedded}/{len(to_embed)} articles")
+        except Exception as e:
+            logger.error(f"Embedding batch failed: {e}")
         conn.close()
-        cleanup_selenium()
+        # keep the browser warm for the next run; it is quit at process exit
+        reset_selenium()
         
     logger.info("Scraping job completed.")
     return all_extracted_data
@@ -0,0 +1,47 @@
+import logging
+import threading
+from functools import lru_cache
+from io import BytesIO
+
+logger = logging.getLogger(__name__)
+
+# PDF engines are imported on first use, so importing this module stays cheap for the API
+@lru_cache(maxsize=None)
+def _get_pdfium():
+    import pypdfium2 as pdfium
+    return pdfium
+
+@lru_cache(maxsize=None)
+def _get_extract_text():
+    from pdfminer.high_level import extract_text
+    return extract_text
+
+# PDFium is not thread-safe, so every call into it in this process goes through one lock.
+# Under gevent the callers are native threadpool threads, so use the unpatched lock.
+try:
+    from gevent import monkey as _gevent_monkey
+    _PDFIUM_LOCK = _gevent_monkey.get_original('threading', 'Lock')()
+except ImportError:
+    _PDFIUM_LOCK = threading.Lock()
+
+def extract_pdf_text(source):
+    """Extract raw text from a PDF (file path or bytes) with PDFium, falling back to
+       pdfminer for documents PDFium rejects (e.g. encrypted or malformed ones)."""
+    pdfium = _get_pdfium()
+    try:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                pages = []
+                for i in range(len(pdf)):
+                    page = pdf[i]
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+                return "\n".join(pages)
+            finally:
+                pdf.close()
+    except pdfium.PdfiumError as e:
+        logger.warning(f"PDFium could not read PDF ({e}), falling back to pdfminer")
+        return _get_extract_text()(source if isinstance(source, str) else BytesIO(source))
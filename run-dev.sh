@@ -3,6 +3,9 @@ echo "Starting in DEVELOPMENT mode..."
 export ENVIRONMENT=development
 export PORT=8080
 export FLASK_APP=app.py
+# Scrape jobs run on Celery; start a worker with embedded beat alongside the dev server
+celery -A tasks worker -B --loglevel=info --schedule=/tmp/celerybeat-schedule &
+celery -A tasks worker -Q scrape --pool=solo -n scrape@%h --loglevel=info &
 # Use Flask built-in reloader so code changes are picked up automatically during development
 python -m flask run --reload --host=0.0.0.0 --port=${PORT}
 
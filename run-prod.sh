@@ -9,5 +9,11 @@ if ! pgrep -x "Xvfb" > /dev/null; then
     export DISPLAY=:99
 fi
 
+# Start Celery worker (scrape jobs) and beat (weekly schedule)
+celery -A tasks worker --loglevel=info --concurrency=${CELERY_CONCURRENCY:-2} &
+# Full scrapes run on a solo-pool worker so PDF extraction can use a process pool
+celery -A tasks worker -Q scrape --pool=solo -n scrape@%h --loglevel=info &
+celery -A tasks beat --loglevel=info --schedule=/tmp/celerybeat-schedule &
+
 # Use gunicorn for production
-gunicorn --config gunicorn.conf.py app:app
\ No newline at end of file
+gunicorn --config gunicorn.conf.py wsgi:app
\ No newline at end of file
@@ -0,0 +1,267 @@
+import os
+import sys
+import json
+import shutil
+import logging
+import traceback
+import threading
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime, timezone
+import redis
+from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_process_shutdown
+from db import db_conn
+import atexit
+import requests as http_requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Broker and result backend (result backend lets the API report task state)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+celery_app = Celery('scraper', broker=REDIS_URL, backend=REDIS_URL)
+celery_app.conf.update(
+    task_track_started=True,
+    result_expires=int(os.getenv("TASK_RESULT_EXPIRES", 86400)),
+    # scrape jobs are long-running; don't let a worker prefetch a second one
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    # crontab entries fire on UTC wall-clock time regardless of host timezone
+    timezone="UTC",
+    enable_utc=True,
+    # beat sleeps until the next due entry; cap a single sleep at an hour (default 5 min)
+    beat_max_loop_interval=int(os.getenv("BEAT_MAX_LOOP_INTERVAL", 3600)),
+    # full scrapes go to their own queue, consumed by a solo-pool worker: prefork children
+    # are daemonic and may not start the process pool used for PDF extraction
+    task_routes={'scrape_reports_task': {'queue': 'scrape'}},
+)
+
+# Run the scraper every Monday at 00:00 UTC (replaces the in-process schedule loop)
+celery_app.conf.beat_schedule = {
+    'weekly-scrape': {
+        'task': 'scrape_reports_task',
+        'schedule': crontab(day_of_week='mon', hour=0, minute=0),
+    }
+}
+
+# NLP embedding service settings, read once at import
+NLP_API_URL = os.getenv("NLP_API_URL")
+NLP_WRITE_TOKEN = os.getenv("NLP_WRITE_TOKEN")
+EMBEDDING_DB = os.getenv("EMBEDDING_DB")
+
+# Keep-alive session for the NLP embedding service so calls reuse warm connections.
+# No transport-level retries: embed_document's Celery retry is the only retry layer.
+_EMBED_SESSION = http_requests.Session()
+_EMBED_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+_EMBED_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+atexit.register(_EMBED_SESSION.close)
+
+# Scraper status of this worker process, guarded by _state_lock so readers see consistent snapshots
+@dataclass
+class ScraperState:
+    last_time: Optional[datetime] = None
+    last_status: str = "Never run"
+    running: bool = False
+
+STATE = ScraperState()
+_state_lock = threading.Lock()
+
+# Single run slot shared by all API and worker processes (atomic SET NX in Redis)
+SCRAPE_LOCK_KEY = os.getenv("SCRAPE_LOCK_KEY", "sdg_scraper:running")
+SCRAPE_LOCK_TTL = int(os.getenv("SCRAPE_LOCK_TTL", 6 * 3600))  # expires if a worker dies mid-run
+_redis = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+
+# With task_acks_late, Redis redelivers any task unacked after visibility_timeout (1h by
+# default). A redelivered scrape keeps its task id and so would pass the run-slot check
+# while the first copy is still running; never redeliver before the slot itself expires.
+celery_app.conf.broker_transport_options = {"visibility_timeout": SCRAPE_LOCK_TTL}
+_RELEASE_LOCK_SCRIPT = _redis.register_script(
+    "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+)
+
+def acquire_scrape_lock(owner):
+    """Claim the scraper run slot for owner (a task id). Returns False if another run holds it."""
+    return bool(_redis.set(SCRAPE_LOCK_KEY, owner, nx=True, ex=SCRAPE_LOCK_TTL))
+
+def release_scrape_lock(owner):
+    """Release the run slot, but only if owner still holds it."""
+    _RELEASE_LOCK_SCRIPT(keys=[SCRAPE_LOCK_KEY], args=[owner])
+
+# File used to persist scraper status (shared across processes)
+STATUS_FILE = os.getenv("SCRAPER_STATUS_FILE", "/tmp/sdg_scraper_status.json")
+
+def _load_scraper_status():
+    try:
+        with open(STATUS_FILE, "r") as fh:
+            return json.load(fh)
+    except Exception:
+        return {
+            "last_run": None,
+            "last_status": "Never run",
+            "currently_running": False
+        }
+
+def _save_scraper_status(last_run, last_status, currently_running):
+    data = {
+        "last_run": last_run.isoformat() if last_run else None,
+        "last_status": last_status,
+        "currently_running": bool(currently_running)
+    }
+    tmp = STATUS_FILE + ".tmp"
+    with open(tmp, "w") as fh:
+        json.dump(data, fh)
+    try:
+        os.replace(tmp, STATUS_FILE)
+    except Exception:
+        # fallback if os.replace not available on some platforms
+        shutil.move(tmp, STATUS_FILE)
+
+def _set_state(**changes):
+    """Update STATE and persist it for the API, under the state lock."""
+    with _state_lock:
+        for k, v in changes.items():
+            setattr(STATE, k, v)
+        _save_scraper_status(STATE.last_time, STATE.last_status, STATE.running)
+
+@worker_process_shutdown.connect
+def _quit_warm_browser(**kwargs):
+    """Quit this pool process's warm Chrome (kept alive between scrapes) when the child is
+       recycled or the worker shuts down; prefork children exit without running atexit hooks."""
+    main = sys.modules.get("main")  # only loaded if this process ever scraped
+    if main is not None:
+        try:
+            main.cleanup_selenium()
+        except Exception as e:
+            logger.warning(f"Failed to quit Selenium on worker shutdown: {e}")
+
+@celery_app.task(bind=True, name='scrape_reports_task')
+def run_scheduled_scraper(self):
+    """Run the scraper and update status"""
+    owner = self.request.id
+    # /scraper/run claims the slot before queueing; beat-triggered runs claim it here
+    if _redis.get(SCRAPE_LOCK_KEY) != owner and not acquire_scrape_lock(owner):
+        logger.info("Scraper is already running, skipping this run")
+        return "Skipped - already running"
+
+    try:
+        from main import scrape_reports
+        _set_state(last_time=datetime.now(timezone.utc), last_status="Running", running=True)
+
+        logger.info("Starting scheduled scraping job...")
+
+        # Run the scraper
+        results = scrape_reports()
+
+        logger.info(f"Scraping completed successfully: {len(results)} reports")
+        _set_state(
+            last_time=datetime.now(timezone.utc),
+            last_status=f"Success - {len(results)} reports processed",
+            running=False
+        )
+
+    except Exception as e:
+        tb = traceback.format_exc()
+        logger.error(f"Scraping failed: {e}\n{tb}")
+        try:
+            # get last traceback frame for file:line info
+            import traceback as _tbmod, sys as _sys
+            tb_list = _tbmod.extract_tb(_sys.exc_info()[2])
+            if tb_list:
+                last_frame = tb_list[-1]
+                frame_info = f"{last_frame.filename}:{last_frame.lineno} in {last_frame.name}"
+            else:
+                frame_info = "no-traceback-frame"
+        except Exception:
+            frame_info = "traceback-extract-failed"
+        # Save concise status with frame info and exception message
+        _set_state(
+            last_time=datetime.now(timezone.utc),
+            last_status=f"Failed - {str(e)} | at {frame_info}",
+            running=False
+        )
+    finally:
+        release_scrape_lock(owner)
+
+    with _state_lock:
+        return STATE.last_status
+
+@celery_app.task(bind=True, name='scrape_url_task')
+def scrape_url_task(self, url, report_type, country, save, embed, title):
+    """Scrape a single URL, optionally save it and embed it.
+       Caller (the API) is responsible for API key / payload validation."""
+    # scraper stack (selenium, bs4, pdf parsers) is only loaded by workers that run scrapes
+    from main import parse_country_report, insert_article_to_db, warm_selenium
+
+    saved_id = None
+
+    # parse_country_report may use Selenium; reuse this worker's warm browser if it does
+    with warm_selenium():
+        article_data, raw_html = parse_country_report(url, report_type or ("AILA" if "aila" in url else "DRA"), country)
+
+    if not article_data:
+        raise RuntimeError("Failed to parse the URL")
+
+    # If caller provided a title, prefer it over parsed title
+    if title:
+        article_data['title'] = title
+
+    if save:
+        try:
+            with db_conn() as conn:
+                saved_id = insert_article_to_db(conn, article_data, raw_html)
+        except Exception as e:
+            logger.error(f"Failed to save scraped URL: {e}")
+            raise RuntimeError(f"Failed to save: {str(e)}")
+
+    # Optionally embed (requires embed params). Embedding is separate from scraping.
+    embed_task_id = None
+    if embed:
+        embed_task_id = queue_embedding(embed, saved_id)
+
+    # Return scraped content + metadata regardless of save
+    return {
+        "message": "Scrape completed",
+        "parsed_success": article_data.get('success', False),
+        "article_data": article_data,
+        "saved_id": saved_id,
+        "embed_task_id": embed_task_id
+    }
+
+class EmbedServiceUnavailable(Exception):
+    """The embedding service answered with a 5xx; worth retrying."""
+
+@celery_app.task(bind=True, name='embed_document_task',
+                 autoretry_for=(http_requests.ConnectionError, http_requests.Timeout, EmbedServiceUnavailable),
+                 retry_backoff=True, max_retries=5)
+def embed_document(self, embed_body, embed_url):
+    """Add a saved document to the NLP embedding service. Connection errors and 5xx are
+       retried with exponential backoff; 4xx (e.g. a bad token) fail immediately."""
+    resp = _EMBED_SESSION.post(
+        f"{embed_url.rstrip('/')}/api/embed/add",
+        json=embed_body,
+        timeout=30
+    )
+    if not resp.ok:
+        logger.error(f"Embedding failed for {embed_body.get('main_id')}: {resp.status_code} {resp.text}")
+    if resp.status_code >= 500:
+        raise EmbedServiceUnavailable(f"{resp.status_code} {resp.text[:200]}")
+    resp.raise_for_status()
+    logger.info(f"Embedded {embed_body.get('main_id')}")
+    return True
+
+def queue_embedding(embed, saved_id):
+    """Queue embed_document for a saved article, or for the caller's embed.main_id when
+       nothing was saved (the API only allows that for callers with a valid API key).
+       Returns the task id."""
+    if not NLP_API_URL:
+        raise RuntimeError("Embedding service not configured")
+    embed_body = {
+        "token": embed.get('token'),
+        "write_access": NLP_WRITE_TOKEN,
+        "db": EMBEDDING_DB,
+        "main_id": f"blog:{saved_id}" if saved_id else embed.get('main_id'),
+    }
+    return embed_document.delay(embed_body, NLP_API_URL).id
@@ -0,0 +1,9 @@
+# gevent must patch the standard library before anything else is imported
+from gevent import monkey
+monkey.patch_all()
+
+# let psycopg2 yield to other greenlets while waiting on the database
+from psycogreen.gevent import patch_psycopg
+patch_psycopg()
+
+from app import app